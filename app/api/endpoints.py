@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, field_validator
 from typing import List
 from app.services.wikipedia_services import WikipediaService
 from app.services.research_agent import ResearchAgent
+from app.services.cache_services import get_cache_service
 
 
 # Respone Models /search - just wiki api no claude
@@ -70,13 +71,16 @@ class ResearchResponse(BaseModel):
 
 
 # Initalize Services
+# Endpoints are plain `def` so FastAPI runs them in its threadpool - Wikipedia,
+# Claude and shared cache lock waits all block.
 router = APIRouter()
-wiki_service = WikipediaService()
-research_agent = ResearchAgent()
+cache = get_cache_service()
+wiki_service = WikipediaService(cache=cache)
+research_agent = ResearchAgent(cache=cache)
 
 
 @router.get("/search/{query}", response_model=WikipediaSearcResponse)
-async def search_wikipedia(query: str):
+def search_wikipedia(query: str):
     """Basic Search - Returns: titles"""
     try:
         results = wiki_service.search_titles(query)
@@ -93,7 +97,7 @@ async def search_wikipedia(query: str):
 
 
 @router.post("/search", response_model=DetailedSearchResponse)
-async def advanced_search(request: SearchRequest):
+def advanced_search(request: SearchRequest):
     "Detailed Search - Returns: titles + summaries"
     start_time = time.time()
 
@@ -126,7 +130,7 @@ async def advanced_search(request: SearchRequest):
 
 
 @router.post("/research", response_model=ResearchResponse)
-async def conduct_ai_research(request: ResearchRequest):
+def conduct_ai_research(request: ResearchRequest):
     """
     AI-powered research endpoint that:
     1. Uses Claude to generate smart search queries
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from dotenv import load_dotenv
+from typing import Any, Callable, Optional, Tuple
+
+load_dotenv()
+
+
+class CacheService:
+    """
+    Shared cache backed by SQLite in WAL mode.
+
+    Every worker process on the host opens the same database file, so Wikipedia
+    articles, Claude responses and research documents fetched by one worker are
+    visible to all of them. get_or_compute() also takes a cross-process lock per
+    key so two workers never compute the same value at the same moment.
+
+    Waiting for another worker's lock blocks the calling thread for up to
+    lock_timeout seconds, so call it from sync code (FastAPI runs plain `def`
+    endpoints in its threadpool), never directly on an event loop.
+    """
+
+    def __init__(self, db_path: str = "cache/shared_cache.sqlite3",
+                 ttl_seconds: int = 86400, lock_timeout: int = 180,
+                 poll_interval: float = 0.1, negative_ttl_seconds: int = 60,
+                 purge_every: int = 100):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.purge_every = purge_every
+        self._writes = 0
+        self._local = threading.local()
+        self._ensure_database_exists()
+
+    def _ensure_database_exists(self):
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS locks (
+                key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self.purge_expired()
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread, reopened after a fork."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def _lookup(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """Return (found, value) so a cached None can be told apart from a miss."""
+        row = self._connection().execute(
+            "SELECT value FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, self._hash_key(key), time.time())
+        ).fetchone()
+        return (True, json.loads(row[0])) if row else (False, None)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        return self._lookup(namespace, key)[1]
+
+    def set(self, namespace: str, key: str, value: Any):
+        """
+        Store a JSON-serializable value for ttl_seconds.
+
+        None is stored for negative_ttl_seconds only, so failed lookups are
+        shared briefly without hiding a page that appears later.
+        """
+        ttl = self.negative_ttl_seconds if value is None else self.ttl_seconds
+        self._connection().execute(
+            "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, self._hash_key(key), json.dumps(value), time.time() + ttl)
+        )
+
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            self.purge_expired()
+
+    def purge_expired(self):
+        """Delete expired entries and abandoned locks."""
+        connection = self._connection()
+        now = time.time()
+        connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        connection.execute("DELETE FROM locks WHERE expires_at <= ?", (now,))
+
+    def _acquire_lock(self, lock_key: str, owner: str) -> bool:
+        connection = self._connection()
+        now = time.time()
+        # Take over locks left behind by a crashed or stuck worker
+        connection.execute("DELETE FROM locks WHERE key = ? AND expires_at <= ?", (lock_key, now))
+        cursor = connection.execute(
+            "INSERT OR IGNORE INTO locks (key, owner, expires_at) VALUES (?, ?, ?)",
+            (lock_key, owner, now + self.lock_timeout)
+        )
+        return cursor.rowcount == 1
+
+    def _release_lock(self, lock_key: str, owner: str):
+        self._connection().execute("DELETE FROM locks WHERE key = ? AND owner = ?", (lock_key, owner))
+
+    def get_or_compute(self, namespace: str, key: str, compute: Callable[[], Any],
+                       should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Return the cached value, computing and storing it on a miss.
+
+        Only one process computes a given key at a time; the others wait for
+        the result. A None result is cached for negative_ttl_seconds so waiters
+        don't repeat a failed fetch one after another.
+
+        Args:
+            namespace: Cache section, e.g. "article" or "claude"
+            key: Identifier within the namespace
+            compute: Called with no arguments to produce the value
+            should_cache: Optional check on a computed non-None value; values it
+                rejects are returned without being stored
+
+        Returns:
+            The cached or freshly computed value
+        """
+        found, value = self._lookup(namespace, key)
+        if found:
+            return value
+
+        lock_key = f"{namespace}:{self._hash_key(key)}"
+        owner = uuid.uuid4().hex
+
+        while not self._acquire_lock(lock_key, owner):
+            time.sleep(self.poll_interval)
+            found, value = self._lookup(namespace, key)
+            if found:
+                return value
+
+        try:
+            # Another worker may have finished between our miss and the lock
+            found, value = self._lookup(namespace, key)
+            if not found:
+                value = compute()
+                if value is None or should_cache is None or should_cache(value):
+                    self.set(namespace, key, value)
+            return value
+        finally:
+            self._release_lock(lock_key, owner)
+
+
+class MemoryCacheService:
+    """
+    In-process stand-in for CacheService with the same interface.
+
+    Useful for tests and single-worker runs; nothing is shared between processes.
+    """
+
+    def __init__(self, ttl_seconds: int = 86400, negative_ttl_seconds: int = 60,
+                 purge_every: int = 100):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.purge_every = purge_every
+        self._writes = 0
+        self._entries = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def _lookup(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """Return (found, value), dropping the entry if it has expired."""
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return False, None
+        if entry[1] <= time.time():
+            self._entries.pop((namespace, key), None)
+            return False, None
+        return True, json.loads(entry[0])
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        return self._lookup(namespace, key)[1]
+
+    def set(self, namespace: str, key: str, value: Any):
+        """Store a JSON-serializable value; None is kept for negative_ttl_seconds."""
+        ttl = self.negative_ttl_seconds if value is None else self.ttl_seconds
+        self._entries[(namespace, key)] = (json.dumps(value), time.time() + ttl)
+
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            self.purge_expired()
+
+    def purge_expired(self):
+        """Delete expired entries."""
+        now = time.time()
+        for entry_key, entry in list(self._entries.items()):
+            if entry[1] <= now:
+                self._entries.pop(entry_key, None)
+
+    def get_or_compute(self, namespace: str, key: str, compute: Callable[[], Any],
+                       should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Return the cached value, computing and storing it on a miss."""
+        found, value = self._lookup(namespace, key)
+        if found:
+            return value
+
+        lock_key = (namespace, key)
+        with self._guard:
+            lock = self._locks.setdefault(lock_key, threading.Lock())
+
+        with lock:
+            try:
+                found, value = self._lookup(namespace, key)
+                if not found:
+                    value = compute()
+                    if value is None or should_cache is None or should_cache(value):
+                        self.set(namespace, key, value)
+                return value
+            finally:
+                # Later callers re-check the cache first, so this lock is no longer needed
+                with self._guard:
+                    if self._locks.get(lock_key) is lock:
+                        del self._locks[lock_key]
+
+
+def get_cache_service():
+    """
+    Build the cache selected by CACHE_BACKEND: "sqlite", "memory" or "none" (default).
+
+    Returns:
+        A CacheService, a MemoryCacheService or None when caching is disabled
+    """
+    backend = os.getenv("CACHE_BACKEND", "none").lower()
+    ttl_seconds = int(os.getenv("CACHE_TTL_SECONDS", "86400"))
+
+    if backend == "sqlite":
+        db_path = os.getenv("CACHE_DB_PATH", "cache/shared_cache.sqlite3")
+        lock_timeout = int(os.getenv("CACHE_LOCK_TIMEOUT_SECONDS", "180"))
+        print(f"🗄️ Using shared SQLite cache: {db_path}")
+        return CacheService(db_path=db_path, ttl_seconds=ttl_seconds, lock_timeout=lock_timeout)
+    if backend == "memory":
+        return MemoryCacheService(ttl_seconds=ttl_seconds)
+    if backend == "none":
+        return None
+
+    raise ValueError(f"Unknown CACHE_BACKEND '{backend}': use sqlite, memory or none")
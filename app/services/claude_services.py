@@ -1,3 +1,4 @@
+import json
 import os
 from anthropic import Anthropic
 from dotenv import load_dotenv
@@ -7,7 +8,7 @@ load_dotenv()
 
 
 class ClaudeService:
-    def __init__(self):
+    def __init__(self, cache=None):
         """Initalize Claude API client"""
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
@@ -15,6 +16,18 @@ class ClaudeService:
 
         self.client = Anthropic(api_key=api_key)
         self.model = "claude-sonnet-4-20250514"
+        self.cache = cache
+
+    def _create_message(self, **kwargs) -> str:
+        """Send a message to Claude and return the response text, cached by request."""
+        def request():
+            message = self.client.messages.create(model=self.model, **kwargs)
+            return message.content[0].text
+
+        if self.cache:
+            key = json.dumps({"model": self.model, **kwargs}, sort_keys=True)
+            return self.cache.get_or_compute("claude", key, request)
+        return request()
 
     def generate_search_queries(self, user_query: str, num_queries: int = 3) -> List[str]:
         """
@@ -47,8 +60,7 @@ class ClaudeService:
                     Your search terms:"""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
+            response_text = self._create_message(
                 max_tokens=200,
                 temperature=0.2,
                 messages=[
@@ -58,7 +70,6 @@ class ClaudeService:
                 system="you are a helpful research assistant"
             )
 
-            response_text = message.content[0].text
             queries = []
             for line in response_text.strip().split('\n'):
                 cleaned = line.strip().lstrip('0123456789.-*# ').strip('"\'*')
@@ -102,8 +113,7 @@ class ClaudeService:
                     Return only titles, no explanations."""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
+            response_text = self._create_message(
                 max_tokens=300,
                 temperature=0.3,
                 messages=[{
@@ -112,7 +122,6 @@ class ClaudeService:
                 }]
             )
 
-            response_text = message.content[0].text
             relevant_titles = [title.strip() for title in response_text.strip().split('\n') if title.strip()]
 
             print(f"Filtered to: {relevant_titles}")
@@ -145,8 +154,7 @@ class ClaudeService:
                     Format as a readable document, not bullet points."""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
+            return self._create_message(
                 max_tokens=4000,
                 temperature=0.5,
                 messages=[{
@@ -156,7 +164,5 @@ class ClaudeService:
                 system="You are an expert research writer who creates clear, comprehensive documents."
             )
 
-            return message.content[0].text
-
         except Exception as e:
             raise Exception(f"Failed to synthesize research: {str(e)}")
@@ -6,10 +6,11 @@ import wikipedia
 
 
 class ResearchAgent:
-    def __init__(self):
+    def __init__(self, cache=None):
         """Initalize agent with Claude and Wiki services."""
-        self.claude = ClaudeService()
-        self.wiki = WikipediaService()
+        self.cache = cache
+        self.claude = ClaudeService(cache=cache)
+        self.wiki = WikipediaService(cache=cache)
         self.file_service = FileService()
 
     def get_full_article_content(self, title: str) -> Dict[str, str]:
@@ -22,6 +23,11 @@ class ResearchAgent:
         Returns:
             Dictionary with title and full content.
         """
+        if self.cache:
+            return self.cache.get_or_compute("article", title, lambda: self._fetch_article(title))
+        return self._fetch_article(title)
+
+    def _fetch_article(self, title: str) -> Dict[str, str]:
         try:
             page = wikipedia.page(title)
             return {
@@ -33,7 +39,7 @@ class ResearchAgent:
         except wikipedia.exceptions.DisambiguationError as e:
             # If ambiguous, try first option
             print(f"⚠️ Disambiguation for '{title}', trying: {e.options[0]}")
-            return self.get_full_article_content(e.options[0])
+            return self._fetch_article(e.options[0])
         except wikipedia.exceptions.PageError:
             print(f"⚠️ Page not found: '{title}'")
             return None
@@ -56,6 +62,28 @@ class ResearchAgent:
         Returns:
             Dictionary containing all research data
         """
+        if self.cache:
+            results = self.cache.get_or_compute(
+                "research",
+                f"{user_query}|{num_searches}",
+                lambda: self._conduct_research(user_query, num_searches),
+                # Don't keep results built from failed Wikipedia lookups, so a retry runs again
+                should_cache=lambda r: 0 < r['total_articles'] == len(r['relevant_titles'])
+            )
+        else:
+            results = self._conduct_research(user_query, num_searches)
+
+        # Step 6: Save to file on every call, cached results included
+        print("\n💾 Step 6: Saving research document...")
+        file_path = self.file_service.save_research_document(
+            query=user_query,
+            document=results['research_document'],
+            metadata=results
+        )
+
+        return {**results, "saved_file_path": file_path}
+
+    def _conduct_research(self, user_query: str, num_searches: int) -> Dict:
         print(f"\n 🔍 Starting research for: {user_query}")
 
         # Step 1: Generate search queries
@@ -111,28 +139,13 @@ class ResearchAgent:
         )
         print("✅ Document synthesis complete!")
 
-        #Step 6: Data processing and save to file
-        print("\n💾 Step 6: Saving research document...")
-        file_path = self.file_service.save_research_document(
-            query=user_query,
-            document=research_document,
-            metadata={
-                'search_queries': search_queries,
-                'total_articles': len(final_articles),
-                'total_words': sum(x['word_count'] for x in final_articles),
-                'candidates_considered': len(candidate_articles),
-                'articles': final_articles
-            }
-        )
-
         return {
             "user_query": user_query,
             "search_queries": search_queries,
+            "relevant_titles": relevant_titles,
             "articles": final_articles,
             "total_articles": len(final_articles),
             "total_words": sum(a['word_count'] for a in final_articles),
             "candidates_considered": len(candidate_articles),
-            "research_document": research_document,
-            "saved_file_path": file_path
+            "research_document": research_document
         }
-
@@ -8,15 +8,23 @@ load_dotenv()
 
 
 class WikipediaService:
-    def __init__(self):
+    def __init__(self, cache=None):
         email = os.getenv('WIKIPEDIA_USER_AGENT_EMAIL')
         if not email:
             raise ValueError('WIKIPEDIA_USER_AGENT_EMAIL must be set in .env file')
 
         wikipedia.set_lang("en")
+        self.cache = cache
 
     def search_titles(self, query: str, max_results: int = 5) -> List[str]:
         """Basic search to return titles."""
+        if self.cache:
+            return self.cache.get_or_compute(
+                "search", f"{query}|{max_results}", lambda: self._search_titles(query, max_results)
+            )
+        return self._search_titles(query, max_results)
+
+    def _search_titles(self, query: str, max_results: int) -> List[str]:
         try:
             results = wikipedia.search(query, results=max_results)
             print(f"Found {len(results)} results: {results}")
@@ -27,6 +35,13 @@ class WikipediaService:
 
     def get_page_summary(self, title: str, sentences: int = 4) -> str:
         """Get summaries for a specific page"""
+        if self.cache:
+            return self.cache.get_or_compute(
+                "summary", f"{title}|{sentences}", lambda: self._get_page_summary(title, sentences)
+            )
+        return self._get_page_summary(title, sentences)
+
+    def _get_page_summary(self, title: str, sentences: int) -> str:
         try:
             return wikipedia.summary(title, sentences=sentences)
         except wikipedia.exceptions.DisambiguationError as e:
@@ -0,0 +1,30 @@
+"""
+Gunicorn config for running several uvicorn workers on one host.
+
+    gunicorn main:app -c gunicorn_conf.py
+
+Workers share Wikipedia articles, Claude responses and research documents
+through the SQLite cache in app/services/cache_services.py.
+"""
+import multiprocessing
+import os
+
+from app.services.cache_services import CacheService
+
+# Workers inherit the master's environment, so they all pick the shared cache
+os.environ.setdefault("CACHE_BACKEND", "sqlite")
+os.environ.setdefault("CACHE_DB_PATH", "cache/shared_cache.sqlite3")
+
+bind = os.getenv("BIND", "127.0.0.1:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count(), 4)))
+worker_class = "uvicorn.workers.UvicornWorker"
+# Each worker builds its own services after the fork
+preload_app = False
+# A full research run can take over a minute
+timeout = 180
+
+
+def on_starting(server):
+    """Create the cache database in WAL mode before any worker starts."""
+    if os.environ["CACHE_BACKEND"].lower() == "sqlite":
+        CacheService(db_path=os.environ["CACHE_DB_PATH"])
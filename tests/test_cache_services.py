@@ -0,0 +1,96 @@
+import multiprocessing
+import time
+
+from app.services.cache_services import CacheService, MemoryCacheService
+
+
+def _compute_once(db_path, queue):
+    cache = CacheService(db_path=db_path)
+
+    def compute():
+        queue.put("computed")
+        time.sleep(0.5)
+        return {"title": "Great Famine"}
+
+    queue.put(cache.get_or_compute("article", "Great Famine", compute))
+
+
+def test_sqlite_single_flight_across_processes(tmp_path):
+    db_path = str(tmp_path / "cache.sqlite3")
+    CacheService(db_path=db_path)
+    queue = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=_compute_once, args=(db_path, queue)) for _ in range(6)]
+
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    results = [queue.get(timeout=5) for _ in range(7)]
+    assert results.count("computed") == 1
+    assert results.count({"title": "Great Famine"}) == 6
+
+
+def test_sqlite_entries_expire_and_are_purged(tmp_path):
+    cache = CacheService(db_path=str(tmp_path / "cache.sqlite3"), ttl_seconds=0, purge_every=10)
+
+    for i in range(10):
+        cache.set("article", str(i), i)
+
+    assert cache.get("article", "0") is None
+    assert cache._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+
+
+def test_sqlite_none_is_cached_briefly(tmp_path):
+    cache = CacheService(db_path=str(tmp_path / "cache.sqlite3"), negative_ttl_seconds=0.2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_compute("article", "Missing page", compute) is None
+    assert cache.get_or_compute("article", "Missing page", compute) is None
+    assert len(calls) == 1
+
+    time.sleep(0.3)
+    cache.get_or_compute("article", "Missing page", compute)
+    assert len(calls) == 2
+
+
+def test_sqlite_stale_lock_is_taken_over(tmp_path):
+    cache = CacheService(db_path=str(tmp_path / "cache.sqlite3"), lock_timeout=60)
+    lock_key = f"article:{cache._hash_key('Great Famine')}"
+    cache._connection().execute(
+        "INSERT INTO locks (key, owner, expires_at) VALUES (?, ?, ?)",
+        (lock_key, "crashed-worker", time.time() - 1)
+    )
+
+    start = time.time()
+    assert cache.get_or_compute("article", "Great Famine", lambda: "content") == "content"
+    assert time.time() - start < 5
+    assert cache._connection().execute("SELECT COUNT(*) FROM locks").fetchone()[0] == 0
+
+
+def test_memory_entries_expire_and_locks_are_dropped():
+    cache = MemoryCacheService(ttl_seconds=0)
+
+    for i in range(100):
+        cache.get_or_compute("article", str(i), lambda: "content")
+
+    assert cache.get("article", "99") is None
+    assert len(cache._entries) == 0
+    assert len(cache._locks) == 0
+
+
+def test_memory_none_is_cached_briefly():
+    cache = MemoryCacheService(negative_ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return None
+
+    cache.get_or_compute("article", "Missing page", compute)
+    cache.get_or_compute("article", "Missing page", compute)
+    assert len(calls) == 1
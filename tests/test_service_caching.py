@@ -0,0 +1,133 @@
+from types import SimpleNamespace
+
+import pytest
+import wikipedia
+
+from app.services.cache_services import MemoryCacheService
+from app.services.claude_services import ClaudeService
+from app.services.research_agent import ResearchAgent
+from app.services.wikipedia_services import WikipediaService
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("WIKIPEDIA_USER_AGENT_EMAIL", "test@example.com")
+    monkeypatch.chdir(tmp_path)
+
+
+class FakeMessages:
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+
+def test_wikipedia_service_uses_cache(monkeypatch):
+    calls = []
+    monkeypatch.setattr(wikipedia, "search", lambda query, results: calls.append(query) or ["Great Famine"])
+    monkeypatch.setattr(wikipedia, "summary", lambda title, sentences: calls.append(title) or "A famine.")
+    service = WikipediaService(cache=MemoryCacheService())
+
+    assert service.search_titles("famine") == ["Great Famine"]
+    assert service.search_titles("famine") == ["Great Famine"]
+    assert service.get_page_summary("Great Famine") == "A famine."
+    assert service.get_page_summary("Great Famine") == "A famine."
+    assert calls == ["famine", "Great Famine"]
+
+
+def test_claude_service_uses_cache():
+    service = ClaudeService(cache=MemoryCacheService())
+    messages = FakeMessages("Great Famine\nIrish Potato Famine")
+    service.client = SimpleNamespace(messages=messages)
+
+    first = service.generate_search_queries("potato famine", num_queries=2)
+    second = service.generate_search_queries("potato famine", num_queries=2)
+
+    assert first == second == ["Great Famine", "Irish Potato Famine"]
+    assert messages.calls == 1
+
+
+def test_research_agent_caches_articles(monkeypatch):
+    calls = []
+
+    def page(title):
+        calls.append(title)
+        return SimpleNamespace(title=title, content="one two three", url="https://en.wikipedia.org/wiki/X")
+
+    monkeypatch.setattr(wikipedia, "page", page)
+    agent = ResearchAgent(cache=MemoryCacheService())
+
+    first = agent.get_full_article_content("Great Famine")
+    second = agent.get_full_article_content("Great Famine")
+
+    assert first == second
+    assert first["word_count"] == 3
+    assert calls == ["Great Famine"]
+
+
+def test_research_agent_caches_research_but_saves_every_call(monkeypatch):
+    agent = ResearchAgent(cache=MemoryCacheService())
+    runs = []
+    saved = []
+    monkeypatch.setattr(agent, "_conduct_research", lambda query, num: runs.append(query) or {
+        "user_query": query,
+        "search_queries": ["Great Famine"],
+        "relevant_titles": ["Great Famine"],
+        "articles": [{"title": "Great Famine", "url": "https://en.wikipedia.org/wiki/Great_Famine",
+                      "content": "one two three", "word_count": 3}],
+        "total_articles": 1,
+        "total_words": 3,
+        "candidates_considered": 0,
+        "research_document": "# Famine"
+    })
+    monkeypatch.setattr(agent.file_service, "save_research_document",
+                        lambda query, document, metadata: saved.append(document) or f"file-{len(saved)}.txt")
+
+    first = agent.conduct_research("Why did the famine happen?")
+    second = agent.conduct_research("Why did the famine happen?")
+
+    assert len(runs) == 1
+    assert saved == ["# Famine", "# Famine"]
+    assert first["saved_file_path"] == "file-1.txt"
+    assert second["saved_file_path"] == "file-2.txt"
+
+
+def test_research_agent_does_not_cache_research_from_failed_lookups(monkeypatch):
+    wikipedia_up = []
+
+    def summary(title, sentences):
+        if not wikipedia_up:
+            raise ConnectionError("Wikipedia unavailable")
+        return "A famine."
+
+    def page(title):
+        if not wikipedia_up:
+            raise ConnectionError("Wikipedia unavailable")
+        return SimpleNamespace(title=title, content="one two three", url="https://en.wikipedia.org/wiki/X")
+
+    monkeypatch.setattr(wikipedia, "search", lambda query, results: ["Great Famine"])
+    monkeypatch.setattr(wikipedia, "summary", summary)
+    monkeypatch.setattr(wikipedia, "page", page)
+    # Expire failed leaf lookups at once so only the research-level caching is under test
+    agent = ResearchAgent(cache=MemoryCacheService(negative_ttl_seconds=0))
+    syntheses = []
+    monkeypatch.setattr(agent.claude, "generate_search_queries", lambda query, num_queries: ["famine"])
+    monkeypatch.setattr(agent.claude, "filter_relevant_articles",
+                        lambda user_query, candidate_articles: ["Great Famine"])
+    monkeypatch.setattr(agent.claude, "synthesize_research",
+                        lambda user_query, articles: syntheses.append(len(articles)) or "# Famine")
+    monkeypatch.setattr(agent.file_service, "save_research_document",
+                        lambda query, document, metadata: "file.txt")
+
+    first = agent.conduct_research("Why did the famine happen?")
+    wikipedia_up.append(True)
+    second = agent.conduct_research("Why did the famine happen?")
+    third = agent.conduct_research("Why did the famine happen?")
+
+    assert first["total_articles"] == 0
+    assert second["total_articles"] == third["total_articles"] == 1
+    assert syntheses == [0, 1]